@@ -1,87 +1,469 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from queue import Queue
+
+import msgspec
+import numpy as np
+import orjson
 from flask import (
+    Blueprint,
     Flask,
     render_template,
     request,
-    jsonify,
     redirect,
     url_for,
-    session,
-    abort
+    abort,
+    g,
+    make_response,
+    stream_with_context,
+    Response
 )
+from werkzeug.local import LocalProxy
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+from flask_compress import Compress
 from parking_system import SmartParkingSystem
 
+
+# Tolerate non-string dict keys (sqlite ints) and serialize numpy scalars
+# without a Python-level float() cast first.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson so body parsing uses the C decoder"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'smart-parking-secret-key'
+# Don't re-sign and resend the session cookie on requests that never touch
+# the session (which is all of them on the polling paths).
+app.config['SESSION_REFRESH_EACH_REQUEST'] = False
+
+# All JSON endpoints live on one blueprint so "is this an API request"
+# becomes a blueprint-name compare instead of a path-prefix scan.
+api = Blueprint('api', __name__, url_prefix='/api')
+
+# Compress JSON/HTML responses (Brotli when the client supports it); the
+# slot and analytics payloads are highly repetitive and shrink 70-90%.
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css'],
+    COMPRESS_LEVEL=5,
+    COMPRESS_MIN_SIZE=500
+)
+Compress(app)
+
+# Cache hot read endpoints; use Redis when configured, otherwise fall back to
+# an in-process cache so local development needs no extra services.
+if os.environ.get('REDIS_HOST'):
+    app.config.update(
+        CACHE_TYPE='RedisCache',
+        CACHE_REDIS_HOST=os.environ['REDIS_HOST'],
+        CACHE_REDIS_PORT=int(os.environ.get('REDIS_PORT', 6379)),
+    )
+else:
+    app.config['CACHE_TYPE'] = 'SimpleCache'
+app.config.update(CACHE_DEFAULT_TIMEOUT=10, CACHE_KEY_PREFIX='parksense_')
+
+cache = Cache(app)
+# Stale fallbacks live in their own cache with a prefix outside
+# parksense_* so invalidate_live_caches' cache.clear() — which drops
+# every live key, SimpleCache-wide or by prefix on Redis — can never
+# take the outage safety net down with it.
+fallback_cache = Cache(app, config={'CACHE_KEY_PREFIX': 'psense_fb_'})
+
+# Pool of DB-layer instances so concurrent request threads never share a
+# connection. Each request checks one out on first use and returns it when
+# the app context tears down; `parking` stays a drop-in name via LocalProxy.
+PARKING_POOL_SIZE = 8
+_parking_pool = Queue(maxsize=PARKING_POOL_SIZE)
+for _ in range(PARKING_POOL_SIZE):
+    _parking_pool.put(SmartParkingSystem())
+
 
-parking = SmartParkingSystem()
+def _acquire_parking() -> SmartParkingSystem:
+    if 'parking' not in g:
+        g.parking = _parking_pool.get()
+    return g.parking
+
+
+@app.teardown_appcontext
+def _release_parking(exc):
+    instance = g.pop('parking', None)
+    if instance is not None:
+        _parking_pool.put(instance)
+
+
+parking = LocalProxy(_acquire_parking)
+
+_thread_local = threading.local()
+
+# Shared worker pool for fan-out reads; sized for the admin dashboard's six
+# independent queries. Reusing it avoids spawning fresh threads per request.
+_read_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix='db-read')
+
+
+def get_thread_parking() -> SmartParkingSystem:
+    """Per-thread SmartParkingSystem so parallel reads don't share a cursor"""
+    if not hasattr(_thread_local, 'parking'):
+        _thread_local.parking = SmartParkingSystem()
+    return _thread_local.parking
 
 USD_TO_INR_RATE = 83
 
 
+def json_response(payload, status_code=200):
+    """Serialize payload with orjson's C encoder instead of stdlib json"""
+    return Response(
+        orjson.dumps(payload, option=ORJSON_OPTIONS),
+        status=status_code,
+        mimetype='application/json'
+    )
+
+
+# Shared empty-payload sentinel; never mutated, so responses without data
+# skip allocating a fresh dict per call.
+_EMPTY = {}
+_EMPTY_BYTES = b'{}'
+
+
 def success_response(data=None, message="Success"):
     """Standardize successful API responses"""
-    return jsonify({
-        'success': True,
-        'data': data or {},
-        'message': message
-    })
+    # Splice pre-encoded envelope fragments around the data bytes instead
+    # of building and encoding the wrapper dict on every call.
+    data_bytes = orjson.dumps(data, option=ORJSON_OPTIONS) if data else _EMPTY_BYTES
+    body = (
+        b'{"success":true,"message":' + orjson.dumps(message)
+        + b',"data":' + data_bytes + b'}'
+    )
+    return Response(body, mimetype='application/json')
+
+
+@app.after_request
+def _conditionalize_api_get(response):
+    """Attach ETags to API GET responses and collapse matches into 304s
+
+    Polling clients mostly see unchanged payloads; the ETag lets them
+    trade those for empty 304s. This runs as an after_request hook, on the
+    outgoing side of cache.cached/l1_cached/stale_on_error: done inside
+    the view, a request whose If-None-Match repopulates an expired cache
+    entry would store the already-emptied 304 and replay it to every
+    client for the TTL window.
+    """
+    if (request.method == 'GET'
+            and response.status_code == 200
+            and response.mimetype == 'application/json'
+            and not response.direct_passthrough
+            # is_streamed covers generator bodies (stream_with_context),
+            # which direct_passthrough does not; hashing one would buffer
+            # the whole stream and defeat the point of streaming it
+            and not response.is_streamed
+            and _is_api_request()):
+        etag = hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'private, max-age=2, must-revalidate'
+        return response.make_conditional(request)
+    return response
 
 
 def error_response(message="An error occurred", status_code=400, data=None):
     """Standardize error API responses"""
-    response = jsonify({
+    return json_response({
         'success': False,
-        'data': data or {},
+        'data': data or _EMPTY,
         'message': message
-    })
-    response.status_code = status_code
-    return response
+    }, status_code)
+
+
+@lru_cache(maxsize=4096)
+def _convert_currency_cached(balance_cents: int, preferred_currency: str):
+    """Compute (usd, inr, display) for a balance quantized to integer cents
+
+    The INR amount is derived in integer cents, so rounding is exact and
+    no float round() is needed on either value.
+    """
+    inr_cents = balance_cents * USD_TO_INR_RATE
+    balance_usd = balance_cents / 100
+    balance_inr = inr_cents / 100
+    display = balance_inr if preferred_currency == 'INR' else balance_usd
+    return balance_usd, balance_inr, display
 
 
 def convert_currency(balance_usd: float, preferred_currency: str = 'USD'):
     """Return balance in both USD and INR"""
-    balance_usd = float(balance_usd or 0)
-    balance_inr = round(balance_usd * USD_TO_INR_RATE, 2)
+    balance_cents = round(float(balance_usd or 0) * 100)
+    usd, inr, display = _convert_currency_cached(balance_cents, preferred_currency)
     return {
-        'balance_usd': round(balance_usd, 2),
-        'balance_inr': balance_inr,
-        'display_balance': balance_inr if preferred_currency == 'INR' else round(balance_usd, 2)
+        'balance_usd': usd,
+        'balance_inr': inr,
+        'display_balance': display
     }
 
 
+class ReserveRequest(msgspec.Struct):
+    user_id: int
+    slot_id: int
+    duration: float
+
+
+class EndReservationRequest(msgspec.Struct):
+    reservation_id: int
+
+
+class AddBalanceRequest(msgspec.Struct):
+    user_id: int
+    amount: float
+
+
+def decode_request(struct_type):
+    """Parse and type-check the JSON body in one msgspec pass
+
+    Returns None on a missing/invalid body so handlers keep their own
+    error messages.
+    """
+    try:
+        return msgspec.json.decode(request.get_data(cache=False), type=struct_type)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+
+
+CURRENCY_COOKIE_MAX_AGE = 31536000  # one year
+
+
 def get_preferred_currency(user_id: int) -> str:
-    return session.get(f'currency_pref_{user_id}', 'USD')
+    # A plain cookie is enough for a two-value preference and skips the
+    # signed-session HMAC verification on every request.
+    return request.cookies.get(f'cur_{user_id}', 'USD')
 
 
-def set_preferred_currency(user_id: int, currency: str):
+def set_preferred_currency(response, user_id: int, currency: str):
     if currency not in {'USD', 'INR'}:
         return False
-    session[f'currency_pref_{user_id}'] = currency
+    response.set_cookie(
+        f'cur_{user_id}',
+        currency,
+        max_age=CURRENCY_COOKIE_MAX_AGE,
+        samesite='Lax'
+    )
     return True
 
 
-@app.before_request
-def cleanup_expired_reservations():
-    """Ensure expired reservations are released on each request"""
-    parking.release_expired_reservations()
+RESERVATION_SWEEP_INTERVAL = 30
+
+AVAILABILITY_SNAPSHOT_INTERVAL = 5
+# RAM-backed path so snapshot reads never touch disk; disabled on
+# platforms without /dev/shm.
+AVAILABILITY_SNAPSHOT_PATH = (
+    '/dev/shm/parksense_availability.json' if os.path.isdir('/dev/shm') else None
+)
+
+
+def _availability_snapshot_writer():
+    """Refresh the RAM-backed availability snapshot for the hot poll path"""
+    while True:
+        try:
+            summary = get_thread_parking().get_availability_summary()
+            body = orjson.dumps({
+                'success': True,
+                'data': summary,
+                'message': "Availability summary fetched successfully"
+            })
+            tmp_path = AVAILABILITY_SNAPSHOT_PATH + '.tmp'
+            with open(tmp_path, 'wb') as snapshot:
+                snapshot.write(body)
+            os.replace(tmp_path, AVAILABILITY_SNAPSHOT_PATH)
+        except Exception:
+            app.logger.exception('Availability snapshot refresh failed')
+        time.sleep(AVAILABILITY_SNAPSHOT_INTERVAL)
+
+
+def _availability_snapshot_response():
+    """Return the pre-serialized snapshot if it exists and is fresh"""
+    path = AVAILABILITY_SNAPSHOT_PATH
+    if not path:
+        return None
+    try:
+        if time.time() - os.path.getmtime(path) > AVAILABILITY_SNAPSHOT_INTERVAL * 2:
+            return None
+        with open(path, 'rb') as snapshot:
+            body = snapshot.read()
+    except OSError:
+        return None
+    return Response(body, mimetype='application/json')
+
+
+def _reservation_sweeper():
+    """Periodically release expired reservations off the request path"""
+    while True:
+        try:
+            get_thread_parking().release_expired_reservations()
+        except Exception:
+            app.logger.exception('Reservation sweep failed')
+        time.sleep(RESERVATION_SWEEP_INTERVAL)
+
+
+def start_reservation_sweeper():
+    thread = threading.Thread(
+        target=_reservation_sweeper,
+        name='reservation-sweeper',
+        daemon=True
+    )
+    thread.start()
+
+
+def start_availability_snapshot_writer():
+    if not AVAILABILITY_SNAPSHOT_PATH:
+        return
+    thread = threading.Thread(
+        target=_availability_snapshot_writer,
+        name='availability-snapshot',
+        daemon=True
+    )
+    thread.start()
+
+
+# Skip the extra background threads in the Werkzeug reloader's parent
+# process. app.debug can't be consulted here — app.run(debug=True) sets it
+# only after this module-level code has run — so the guard keys on how the
+# module was loaded: a WSGI server imports it (no reloader involved), and
+# under direct execution only the reloader child, marked by
+# WERKZEUG_RUN_MAIN, serves requests.
+if __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+    start_reservation_sweeper()
+    start_availability_snapshot_writer()
 
 
 @app.route('/')
 def index():
     """Main dashboard"""
+    summary = get_cached_summary()
+    return render_template('dashboard.html', summary=summary, quick_links=QUICK_LINKS)
+
+
+STALE_FALLBACK_TIMEOUT = 3600
+
+
+def stale_on_error(view):
+    """Serve the last known-good response when the fresh path raises
+
+    Each successful response is stored under a long-lived fallback key, so a
+    DB outage degrades aggregate endpoints to slightly stale data instead of
+    a 500. Adds no work to the happy path beyond one cache write.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        fallback_key = f'fallback:{request.endpoint}'
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception:
+            stale = fallback_cache.get(fallback_key)
+            if stale is None:
+                raise
+            stale.headers['X-Cache'] = 'stale'
+            return stale
+        fallback_cache.set(fallback_key, response, timeout=STALE_FALLBACK_TIMEOUT)
+        return response
+    return wrapper
+
+
+# Tiny in-process L1 in front of the shared cache: even a Redis GET costs a
+# network round-trip, which the steady-state poll path doesn't need to pay.
+L1_CACHE_TTL = 3
+_l1_cache = {}
+_l1_lock = threading.Lock()
+
+
+def l1_cached(key, ttl=L1_CACHE_TTL):
+    """Serve repeat hits from a process-local TTL dict before the shared cache
+
+    Entries are (body, status, headers) snapshots rebuilt into a fresh
+    Response per hit: the after_request stages (compression, ETag/304)
+    mutate the outgoing response in place, so replaying one live object
+    would serve the first client's negotiated encoding to everyone. Only
+    full 200s are stored so an error or 304 never occupies the slot.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            now = time.monotonic()
+            with _l1_lock:
+                entry = _l1_cache.get(key)
+                if entry is not None and entry[1] > now:
+                    body, status, headers = entry[0]
+                    return Response(body, status=status, headers=headers)
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200 and not response.direct_passthrough:
+                snapshot = (response.get_data(), response.status_code,
+                            list(response.headers))
+                with _l1_lock:
+                    _l1_cache[key] = (snapshot, now + ttl)
+            return response
+        return wrapper
+    return decorator
+
+
+# Data-level twin of the L1 response cache for views that render templates
+# from the summary rather than returning it as JSON.
+SUMMARY_CACHE_TTL = 2
+_summary_cache = {'value': None, 'expires': 0.0}
+_summary_lock = threading.Lock()
+
+
+def get_cached_summary():
+    """Share one get_availability_summary round-trip across burst traffic"""
+    now = time.monotonic()
+    with _summary_lock:
+        if _summary_cache['value'] is not None and _summary_cache['expires'] > now:
+            return _summary_cache['value']
     summary = parking.get_availability_summary()
-    quick_links = [
-        {'label': 'Reservations', 'url': url_for('reservations'), 'icon': 'bi-calendar-check'},
-        {'label': 'Analytics', 'url': url_for('analytics'), 'icon': 'bi-graph-up'},
-        {'label': 'Users', 'url': url_for('users'), 'icon': 'bi-people'},
-        {'label': 'Admin', 'url': url_for('admin_dashboard'), 'icon': 'bi-speedometer'}
-    ]
-    return render_template('dashboard.html', summary=summary, quick_links=quick_links)
-
-
-@app.route('/api/availability')
+    with _summary_lock:
+        _summary_cache['value'] = summary
+        _summary_cache['expires'] = time.monotonic() + SUMMARY_CACHE_TTL
+    return summary
+
+
+def invalidate_live_caches():
+    """Drop cached availability/slot/analytics responses after a state change"""
+    with _l1_lock:
+        _l1_cache.clear()
+    with _summary_lock:
+        _summary_cache['value'] = None
+    # Slot responses are keyed per query string, so there is one entry per
+    # filter combination; clearing the cache is the only way to hit them
+    # all. The stale fallbacks sit in fallback_cache and survive this.
+    cache.clear()
+    # The availability view prefers the /dev/shm snapshot, which tolerates
+    # up to twice its refresh interval of staleness — long enough for a
+    # user to still see the slot they just reserved as free. Drop it so
+    # the next poll reads live data; the writer thread rebuilds it on its
+    # next cycle.
+    if AVAILABILITY_SNAPSHOT_PATH:
+        try:
+            os.unlink(AVAILABILITY_SNAPSHOT_PATH)
+        except OSError:
+            pass
+
+
+@api.route('/availability')
+@l1_cached('availability')
+@cache.cached(timeout=5)
+@stale_on_error
 def api_availability():
     """API endpoint for live availability updates"""
+    snapshot = _availability_snapshot_response()
+    if snapshot is not None:
+        return snapshot
     summary = parking.get_availability_summary()
     return success_response(summary, "Availability summary fetched successfully")
 
@@ -93,7 +475,24 @@ def slots():
     return render_template('slots.html', slots=all_slots)
 
 
-@app.route('/api/slots')
+def _slots_cache_key():
+    """Bounded cache key for /api/slots built from the filter args only
+
+    Cheaper than hashing the full query string and keeps the key space
+    limited to the filters the endpoint actually understands.
+    """
+    args = request.args
+    return 'slots:{}:{}:{}:{}:{}'.format(
+        args.get('floor', ''),
+        args.get('zone', ''),
+        args.get('type', ''),
+        args.get('max_price', ''),
+        args.get('format', '')
+    )
+
+
+@api.route('/slots')
+@cache.cached(timeout=5, make_cache_key=_slots_cache_key)
 def api_slots():
     """API endpoint for live slot updates"""
     floor = request.args.get('floor', type=int)
@@ -101,18 +500,22 @@ def api_slots():
     slot_type = request.args.get('type')
     max_price = request.args.get('max_price', type=float)
 
-    slots = parking.search_available_slots_optimized(floor, zone, slot_type, max_price)
-    slots_data = [{
-        'id': s[0],
-        'number': s[1],
-        'floor': s[2],
-        'zone': s[3],
-        'type': s[4],
-        'available': bool(s[5]),
-        'price': float(s[6])
-    } for s in slots]
+    # Legacy array-of-structs shape for clients that have not migrated yet
+    if request.args.get('format') == 'aos':
+        slots = parking.search_available_slots_optimized(floor, zone, slot_type, max_price)
+        slots_data = [{
+            'id': s[0],
+            'number': s[1],
+            'floor': s[2],
+            'zone': s[3],
+            'type': s[4],
+            'available': bool(s[5]),
+            'price': float(s[6])
+        } for s in slots]
+        return success_response({'slots': slots_data}, "Slots fetched successfully")
 
-    return success_response({'slots': slots_data}, "Slots fetched successfully")
+    columns = parking.search_available_slots_columnar(floor, zone, slot_type, max_price)
+    return success_response({'slots_columnar': columns}, "Slots fetched successfully")
 
 
 @app.route('/reservations')
@@ -121,42 +524,34 @@ def reservations():
     return render_template('reservations.html')
 
 
-@app.route('/api/reserve', methods=['POST'])
+@api.route('/reserve', methods=['POST'])
 def api_reserve():
     """Create a new reservation"""
-    data = request.get_json(silent=True) or {}
-    user_id = data.get('user_id')
-    slot_id = data.get('slot_id')
-    duration = data.get('duration')
-
-    if not all([user_id, slot_id, duration]):
+    req = decode_request(ReserveRequest)
+    if req is None:
         return error_response("user_id, slot_id and duration are required.", 400)
 
-    try:
-        duration = float(duration)
-    except (TypeError, ValueError):
-        return error_response('duration must be a number', 400)
-
-    reservation_id, message = parking.create_reservation_with_payment(user_id, slot_id, duration)
+    reservation_id, message = parking.create_reservation_with_payment(
+        req.user_id, req.slot_id, req.duration)
 
     if reservation_id:
+        invalidate_live_caches()
         return success_response({'reservation_id': reservation_id}, message)
     return error_response(message, 400)
 
 
-@app.route('/api/end-reservation', methods=['POST'])
+@api.route('/end-reservation', methods=['POST'])
 def api_end_reservation():
     """End a reservation"""
-    data = request.get_json(silent=True) or {}
-    reservation_id = data.get('reservation_id')
-
-    if not reservation_id:
+    req = decode_request(EndReservationRequest)
+    if req is None:
         return error_response("reservation_id is required", 400)
 
-    success = parking.end_reservation(reservation_id)
+    success = parking.end_reservation(req.reservation_id)
 
     if success:
-        return success_response({'reservation_id': reservation_id}, "Reservation ended successfully")
+        invalidate_live_caches()
+        return success_response({'reservation_id': req.reservation_id}, "Reservation ended successfully")
     else:
         return error_response('Failed to end reservation', 400)
 
@@ -169,7 +564,9 @@ def analytics():
     return render_template('analytics.html', predictions=predictions, revenue=revenue)
 
 
-@app.route('/api/analytics')
+@api.route('/analytics')
+@cache.cached(timeout=30)
+@stale_on_error
 def api_analytics():
     """API endpoint for live analytics updates"""
     predictions = parking.predict_peak_demand()
@@ -184,25 +581,17 @@ def users():
     return render_template('users.html')
 
 
-@app.route('/api/add-balance', methods=['POST'])
+@api.route('/add-balance', methods=['POST'])
 def api_add_balance():
     """Add balance to user wallet"""
-    data = request.get_json(silent=True) or {}
-    user_id = data.get('user_id')
-    amount = data.get('amount')
-
-    if not all([user_id, amount]):
+    req = decode_request(AddBalanceRequest)
+    if req is None:
         return error_response('user_id and amount are required', 400)
 
-    try:
-        amount = float(amount)
-    except (TypeError, ValueError):
-        return error_response('amount must be a positive number', 400)
-
-    success = parking.add_wallet_balance(user_id, amount)
+    success = parking.add_wallet_balance(req.user_id, req.amount)
 
     if success:
-        user = parking.get_user_by_id(user_id)
+        user = parking.get_user_by_id(req.user_id)
         return success_response({'user': user}, "Balance added successfully")
     else:
         return error_response('Failed to add balance', 400)
@@ -211,18 +600,18 @@ def api_add_balance():
 @app.route('/profile/<int:user_id>', methods=['GET', 'POST'])
 def profile(user_id: int):
     """Display user profile with wallet summary"""
-    user = parking.get_user_by_id(user_id)
+    user, reservations = parking.get_user_with_reservations(user_id)
     if not user:
         abort(404, description="User not found")
 
     if request.method == 'POST':
         currency = request.form.get('preferred_currency')
-        if set_preferred_currency(user_id, currency):
-            return redirect(url_for('profile', user_id=user_id))
+        response = redirect(url_for('profile', user_id=user_id))
+        if set_preferred_currency(response, user_id, currency):
+            return response
 
     preferred_currency = get_preferred_currency(user_id)
     balances = convert_currency(user['wallet_balance'], preferred_currency)
-    reservations = parking.get_user_reservations(user_id)
 
     return render_template(
         'profile.html',
@@ -233,34 +622,42 @@ def profile(user_id: int):
     )
 
 
-@app.route('/api/user/<int:user_id>')
+@api.route('/user/<int:user_id>')
 def api_user(user_id: int):
     """Return user profile and reservation information"""
-    user = parking.get_user_by_id(user_id)
+    user, reservations = parking.get_user_with_reservations(user_id)
     if not user:
         return error_response("User not found", 404)
 
     preferred_currency = get_preferred_currency(user_id)
     balances = convert_currency(user['wallet_balance'], preferred_currency)
-    reservations = [
-        {
-            'slot_number': r['slot_number'],
-            'start': r['start_time'],
-            'duration': r['duration_hours'],
-            'status': r['status']
-        }
-        for r in parking.get_user_reservations(user_id)
-    ]
-
-    data = {
+    profile_fields = {
         'user_id': user['user_id'],
         'name': user['username'],
         'balance_usd': balances['balance_usd'],
         'balance_inr': balances['balance_inr'],
-        'preferred_currency': preferred_currency,
-        'reservations': reservations
+        'preferred_currency': preferred_currency
     }
-    return success_response(data, "User profile fetched successfully")
+
+    def generate():
+        # Emit the envelope and profile fields, then one reservation at a
+        # time, so heavy reservation histories never sit fully in memory
+        # and the first bytes reach the client sooner.
+        yield (b'{"success":true,"message":"User profile fetched successfully","data":'
+               + orjson.dumps(profile_fields)[:-1] + b',"reservations":[')
+        first = True
+        for r in reservations:
+            item = orjson.dumps({
+                'slot_number': r['slot_number'],
+                'start': r['start_time'],
+                'duration': r['duration_hours'],
+                'status': r['status']
+            })
+            yield item if first else b',' + item
+            first = False
+        yield b']}}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/profile/<int:user_id>/currency', methods=['POST'])
@@ -272,37 +669,58 @@ def update_currency(user_id: int):
     if not currency:
         return error_response('preferred_currency is required', 400)
 
-    if set_preferred_currency(user_id, currency.upper()):
-        return success_response({'preferred_currency': currency.upper()}, 'Currency preference updated')
+    currency = currency.upper()
+    response = success_response({'preferred_currency': currency}, 'Currency preference updated')
+    if set_preferred_currency(response, user_id, currency):
+        return response
 
     return error_response('Invalid currency option', 400)
 
 
 @app.route('/admin')
+@stale_on_error
 def admin_dashboard():
     """Admin dashboard with revenue and occupancy insights"""
-    revenue = parking.get_revenue_report()
-    active_reservations = parking.get_active_reservations()
-    summary = parking.get_availability_summary()
-    occupancy_by_floor = parking.get_occupancy_by_floor()
-    occupancy_by_zone = parking.get_occupancy_by_zone()
-    wallet_transactions = parking.get_wallet_transactions()
+    fetchers = {
+        'revenue': lambda: get_thread_parking().get_revenue_report(),
+        'active_reservations': lambda: get_thread_parking().get_active_reservations(),
+        'summary': lambda: get_thread_parking().get_availability_summary(),
+        'occupancy_by_floor': lambda: get_thread_parking().get_occupancy_by_floor(),
+        'occupancy_by_zone': lambda: get_thread_parking().get_occupancy_by_zone(),
+        'wallet_transactions': lambda: get_thread_parking().get_wallet_transactions()
+    }
 
-    return render_template(
-        'admin.html',
-        revenue=revenue,
-        active_reservations=active_reservations,
-        summary=summary,
-        occupancy_by_floor=occupancy_by_floor,
-        occupancy_by_zone=occupancy_by_zone,
-        wallet_transactions=wallet_transactions
-    )
+    # The six reads are independent; run them concurrently so the page
+    # waits for the slowest query instead of the sum of all of them.
+    futures = {key: _read_executor.submit(fn) for key, fn in fetchers.items()}
+    results = {key: future.result() for key, future in futures.items()}
+
+    # Convert transaction amounts to INR in one vectorized pass rather
+    # than a Python multiply per row.
+    transactions = results['wallet_transactions']
+    if transactions:
+        amounts_usd = np.fromiter(
+            (tx['amount'] for tx in transactions),
+            dtype=np.float64,
+            count=len(transactions)
+        )
+        amounts_inr = np.round(amounts_usd * USD_TO_INR_RATE, 2)
+        for tx, amount_inr in zip(transactions, amounts_inr):
+            tx['amount_inr'] = float(amount_inr)
+
+    return render_template('admin.html', **results)
+
+
+def _is_api_request() -> bool:
+    # Routing-level 404s never get a blueprint assigned, so fall back to the
+    # path prefix for those.
+    return request.blueprint == 'api' or request.path.startswith('/api/')
 
 
 @app.errorhandler(404)
 def not_found(error):
     message = getattr(error, 'description', 'Resource not found')
-    if request.path.startswith('/api/'):
+    if _is_api_request():
         return error_response(message, 404)
     return render_template('errors/404.html', message=message), 404
 
@@ -310,10 +728,28 @@ def not_found(error):
 @app.errorhandler(500)
 def server_error(error):
     message = 'An internal server error occurred.'
-    if request.path.startswith('/api/'):
+    if _is_api_request():
         return error_response(message, 500)
     return render_template('errors/500.html', message=message), 500
 
 
+app.register_blueprint(api)
+
+
+# The quick links never change at runtime; resolve the url_for lookups once
+# at import instead of four URL-map traversals per dashboard hit.
+with app.test_request_context():
+    QUICK_LINKS = (
+        {'label': 'Reservations', 'url': url_for('reservations'), 'icon': 'bi-calendar-check'},
+        {'label': 'Analytics', 'url': url_for('analytics'), 'icon': 'bi-graph-up'},
+        {'label': 'Users', 'url': url_for('users'), 'icon': 'bi-people'},
+        {'label': 'Admin', 'url': url_for('admin_dashboard'), 'icon': 'bi-speedometer'}
+    )
+
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # threaded=True lets the dev server overlap IO-bound DB calls instead of
+    # serializing every client behind one request. Production deployments
+    # should front the app with a real WSGI server, e.g.
+    # gunicorn --threads 8 app:app
+    app.run(host='0.0.0.0', port=5000, debug=True, threaded=True)
@@ -1,8 +1,195 @@
 import sqlite3
 from datetime import datetime, timedelta
+from contextlib import contextmanager
 from typing import List, Optional, Tuple, Dict
-import random
+import itertools
+import logging
 import os
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class _AbortTransaction(Exception):
+    """Raised inside a _tx_immediate block to roll back with a caller message"""
+
+# Statements shared by several methods live in module constants so every
+# call site passes the identical string and hits the same cached prepared
+# statement instead of re-parsing a slightly different literal.
+_SQL_COMPLETE_RESERVATION = '''
+    UPDATE reservations
+    SET status = 'completed', end_time = ?
+    WHERE reservation_id = ?
+'''
+
+_SQL_FREE_SLOT_FOR_RESERVATION = '''
+    UPDATE parking_slots SET is_available = 1
+    WHERE slot_id = (SELECT slot_id FROM reservations WHERE reservation_id = ?)
+    RETURNING slot_id
+'''
+
+_SQL_ACTIVE_RES_FOR_USER = '''
+    SELECT 1 FROM reservations
+    WHERE user_id = ? AND status = 'active'
+    LIMIT 1
+'''
+
+_SQL_CLAIM_SLOT = '''
+    UPDATE parking_slots SET is_available = 0
+    WHERE slot_id = ? AND is_available = 1
+    RETURNING price_per_hour
+'''
+
+_SQL_INSERT_RESERVATION = '''
+    INSERT INTO reservations (user_id, slot_id, start_time, end_time, duration_hours, total_amount, payment_status, status)
+    VALUES (?, ?, ?, ?, ?, ?, 'completed', 'active')
+    RETURNING reservation_id
+'''
+
+_SQL_DEDUCT_WALLET = '''
+    UPDATE users
+    SET wallet_balance = wallet_balance - ?
+    WHERE user_id = ? AND wallet_balance >= ?
+      AND NOT EXISTS (SELECT 1 FROM reservations
+                      WHERE user_id = ? AND status = 'active')
+'''
+
+_SQL_INSERT_WALLET_DEBIT = '''
+    INSERT INTO wallet_transactions (user_id, amount, transaction_type, description)
+    VALUES (?, ?, 'debit', 'Reservation payment')
+'''
+
+_SQL_INSERT_PAYMENT = '''
+    INSERT INTO payments (reservation_id, user_id, amount, payment_method, transaction_id, payment_status)
+    VALUES (?, ?, ?, ?, printf('TXN%s%d', strftime('%Y%m%d%H%M%S', 'now', 'localtime'), ?), 'completed')
+    RETURNING transaction_id
+'''
+
+# The expiry sweep is two set-based statements: free every slot held by an
+# overdue reservation, then complete those reservations. Both predicates
+# range-scan the partial idx_reservations_active_end index.
+_SQL_RELEASE_EXPIRED_SLOTS = '''
+    UPDATE parking_slots SET is_available = 1
+    WHERE slot_id IN (SELECT slot_id FROM reservations
+                      WHERE status = 'active' AND end_time <= ?)
+'''
+
+_SQL_RELEASE_EXPIRED_RES = '''
+    UPDATE reservations
+    SET status = 'completed', end_time = ?
+    WHERE status = 'active' AND end_time <= ?
+'''
+
+_SQL_UPSERT_STATS = '''
+    INSERT INTO utilization_stats (slot_id, date, hour, occupancy_count, revenue)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(slot_id, date, hour) DO UPDATE SET
+        occupancy_count = occupancy_count + excluded.occupancy_count,
+        revenue = revenue + excluded.revenue
+'''
+
+
+# Peak-demand analytics in a single statement: the three aggregations are
+# tagged and concatenated with UNION ALL, so one execute replaces three
+# prepare/execute round-trips and the rows are partitioned back in Python.
+_SQL_PEAK_DEMAND = '''
+    SELECT 'hour' AS tag, hour, AVG(occupancy_count), SUM(revenue)
+    FROM utilization_stats
+    GROUP BY hour
+    UNION ALL
+    SELECT 'zone', p.zone, COUNT(r.reservation_id), SUM(r.total_amount)
+    FROM reservations r
+    JOIN parking_slots p ON r.slot_id = p.slot_id
+    WHERE p.zone IS NOT NULL
+    GROUP BY p.zone
+    UNION ALL
+    SELECT 'type', p.slot_type, COUNT(r.reservation_id), NULL
+    FROM reservations r
+    JOIN parking_slots p ON r.slot_id = p.slot_id
+    GROUP BY p.slot_type
+'''
+
+
+# Revenue report in a single statement: the completed-payments CTE is
+# shared across the total, last-seven-days and per-type aggregations,
+# which are tagged and concatenated like the peak-demand statement above.
+# The daily branch wraps its GROUP BY in a subquery because UNION ALL
+# arms cannot carry their own ORDER BY/LIMIT directly.
+_SQL_REVENUE_REPORT = '''
+    WITH paid AS (
+        SELECT reservation_id, amount, payment_date FROM payments
+        WHERE payment_status = 'completed'
+    )
+    SELECT 'total' AS tag, NULL, SUM(amount) FROM paid
+    UNION ALL
+    SELECT 'daily', day, day_total FROM (
+        SELECT DATE(payment_date) AS day, SUM(amount) AS day_total
+        FROM paid
+        GROUP BY day
+        ORDER BY day DESC
+        LIMIT 7
+    )
+    UNION ALL
+    SELECT 'type', p.slot_type, SUM(pay.amount)
+    FROM paid pay
+    JOIN reservations r ON pay.reservation_id = r.reservation_id
+    JOIN parking_slots p ON r.slot_id = p.slot_id
+    GROUP BY p.slot_type
+'''
+
+
+def _build_slot_search_table() -> Dict[Tuple[bool, bool, bool, bool], str]:
+    """Precompute the slot-search SQL for every filter combination
+
+    The search takes four optional filters, giving sixteen possible
+    statements. Building them once means each call does a dict lookup
+    instead of string concatenation, and every combination always executes
+    the identical string so sqlite3's statement cache is guaranteed to hit.
+    Keys are (floor set, zone set, type set, price set) flags.
+    """
+    base = '''SELECT slot_id, slot_number, floor_number, zone, slot_type,
+                          is_available, price_per_hour
+                   FROM parking_slots WHERE is_available = 1'''
+    clauses = (' AND floor_number = ?', ' AND zone = ?',
+               ' AND slot_type = ?', ' AND price_per_hour <= ?')
+    order = ' ORDER BY price_per_hour, floor_number, slot_number'
+    table = {}
+    for key in itertools.product((False, True), repeat=len(clauses)):
+        filters = ''.join(clause for used, clause in zip(key, clauses) if used)
+        table[key] = base + filters + order
+    return table
+
+
+_SLOT_SEARCH_SQL = _build_slot_search_table()
+
+
+def _build_util_stats_table() -> Dict[Tuple[bool, bool], str]:
+    """Precompute the utilization-stats SQL for every filter combination
+
+    Same scheme as the slot-search table: the two optional filters give
+    four statement shapes, each a fixed string, so the old WHERE 1=1
+    concatenation (a fresh string per call) is gone and the statement
+    cache hits every time. Keys are (slot set, date set) flags.
+    """
+    base = '''SELECT stat_id, slot_id, date, hour, occupancy_count, revenue
+                   FROM utilization_stats'''
+    clauses = ('slot_id = ?', 'date = ?')
+    order = ' ORDER BY date DESC, hour DESC'
+    table = {}
+    for key in itertools.product((False, True), repeat=len(clauses)):
+        used = [clause for flag, clause in zip(key, clauses) if flag]
+        where = ' WHERE ' + ' AND '.join(used) if used else ''
+        table[key] = base + where + order
+    return table
+
+
+_UTIL_STATS_SQL = _build_util_stats_table()
+
+
+_STATS_FLUSH_INTERVAL = 2.0   # seconds between write-behind stats flushes
+_STATS_FLUSH_MAX = 128        # flush immediately past this many dirty buckets
+
 
 class SmartParkingSystem:
     """
@@ -16,17 +203,123 @@ class SmartParkingSystem:
         self.db_name = db_name
         self.conn = None
         self.cursor = None
+        # Instance-level read caches: availability queries repeat far more
+        # often than slots change, so results are kept until the next write
+        self._summary_cache = None
+        self._avail_cache = {}
+        # Analytics results are memoized against a write-generation
+        # counter: any committed write bumps it, so dashboards re-reading
+        # between writes reuse the previous aggregation
+        self._gen = 0
+        self._analytics_cache = {}
+        # Last observed PRAGMA data_version; a change means some other
+        # connection committed a write, so the caches above must be dropped
+        self._data_version = None
+        # Write-behind buffer for utilization_stats: reservations in the
+        # same (slot, date, hour) bucket contend on one page, so increments
+        # accumulate here and flush as a single batched UPSERT
+        self._stats_buffer = {}
+        self._stats_last_flush = time.monotonic()
         self.initialize_database()
     
     def connect(self):
-        """Establish database connection"""
-        self.conn = sqlite3.connect(self.db_name)
-        self.cursor = self.conn.cursor()
-    
+        """Ensure the persistent database connection is open
+
+        Opening a SQLite connection re-reads the file header and schema, so
+        instead of a connect/close pair per method the connection is opened
+        once and reused for the lifetime of the instance. A generous busy
+        timeout makes concurrent writers queue on SQLite's lock instead of
+        failing immediately with "database is locked".
+        """
+        if self.conn is None:
+            # cached_statements keeps every distinct query's compiled plan
+            # resident; the schema has more statements than the default 128.
+            # check_same_thread is off because instances are constructed at
+            # import time but served from worker threads; callers (the app's
+            # pool checkout / thread-locals) guarantee one thread at a time
+            # per instance, which is all SQLite actually requires
+            self.conn = sqlite3.connect(self.db_name, timeout=30, cached_statements=256,
+                                        check_same_thread=False)
+            # Row keeps tuple-style access working but adds keyed access,
+            # so callers name columns instead of counting them
+            self.conn.row_factory = sqlite3.Row
+            self.cursor = self.conn.cursor()
+            self._apply_pragmas()
+
+    def _apply_pragmas(self):
+        """Tune the fresh connection for this write-light, read-heavy workload
+
+        WAL lets readers proceed concurrently with the single writer and
+        replaces the rollback journal's fsync pair per commit;
+        synchronous=NORMAL is durable enough under WAL and skips one fsync
+        per transaction.
+        """
+        self.cursor.execute('PRAGMA journal_mode=WAL')
+        self.cursor.execute('PRAGMA synchronous=NORMAL')
+        self.cursor.execute('PRAGMA busy_timeout=5000')
+        self.cursor.execute('PRAGMA temp_store=MEMORY')
+        self.cursor.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+        self.cursor.execute('PRAGMA mmap_size=268435456')  # read pages via mmap, up to 256 MB
+        self.cursor.execute('PRAGMA foreign_keys=ON')
+
+    @contextmanager
+    def _tx_immediate(self):
+        """Run a block inside a BEGIN IMMEDIATE transaction
+
+        IMMEDIATE takes the write lock up front so the transaction never
+        has to upgrade from a shared lock mid-flight. Commits on normal
+        exit, rolls back on any exception (including _AbortTransaction,
+        which business-rule checks raise to bail out with a message).
+        """
+        self.connect()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def _invalidate_read_caches(self):
+        """Drop cached read results after any slot-state write"""
+        self._summary_cache = None
+        self._avail_cache.clear()
+        self._gen += 1
+
+    def _check_external_writes(self):
+        """Drop cached reads if another connection committed a write
+
+        The web layer runs many instances at once (a request pool plus
+        per-thread instances), so a write through one must not leave the
+        others serving stale caches forever. PRAGMA data_version changes
+        whenever a different connection modifies the database file, which
+        makes one cheap pragma per cached read a complete coherence check.
+        Writes on this connection don't move data_version; those paths
+        already call _invalidate_read_caches directly.
+        """
+        self.connect()
+        version = self.cursor.execute('PRAGMA data_version').fetchone()[0]
+        if version != self._data_version:
+            self._data_version = version
+            self._invalidate_read_caches()
+
     def close(self):
-        """Close database connection"""
+        """Close the persistent database connection"""
         if self.conn:
+            self.flush_stats()
+            # Give SQLite a chance to refresh stale statistics for whatever
+            # query mix this connection actually ran
+            self.cursor.execute('PRAGMA optimize')
             self.conn.close()
+            self.conn = None
+            self.cursor = None
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
     
     def initialize_database(self):
         """MODULE 1: Create optimized database schema with indexes"""
@@ -121,20 +414,77 @@ class SmartParkingSystem:
         ''')
         
         # MODULE 2: Create indexes for query optimization
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_slots_availability ON parking_slots(is_available)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_slots_floor ON parking_slots(floor_number)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_slots_zone ON parking_slots(zone)')
-        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_slots_type ON parking_slots(slot_type)')
+        # The old single-column slot indexes are gone on purpose: the
+        # planner would pick one of them over the composite below and then
+        # scan or sort the survivors, so fewer alternatives means better
+        # plans. Drop them from databases created before the composites.
+        self.cursor.execute('DROP INDEX IF EXISTS idx_slots_availability')
+        self.cursor.execute('DROP INDEX IF EXISTS idx_slots_floor')
+        self.cursor.execute('DROP INDEX IF EXISTS idx_slots_zone')
+        self.cursor.execute('DROP INDEX IF EXISTS idx_slots_type')
+        # Composite index matching the slot-search predicate: equality on
+        # availability/floor/zone/type as the left prefix, price range last
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_slots_search
+                               ON parking_slots(is_available, floor_number, zone, slot_type, price_per_hour)''')
+        # Partial variant holding only available rows: smaller to scan, its
+        # leading columns match the search's equality filters, and the
+        # trailing columns make it covering for the slot search
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_slots_avail_search
+                               ON parking_slots(zone, floor_number, slot_type,
+                                                price_per_hour, slot_number)
+                               WHERE is_available = 1''')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservations_user ON reservations(user_id)')
+        # Covering index for the per-user history listing: newest-first order
+        # comes straight off the index and every selected reservation column
+        # is present, so the base table is never visited
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_reservations_user_start
+                               ON reservations(user_id, start_time DESC, status,
+                                               slot_id, reservation_id, duration_hours)''')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservations_slot ON reservations(slot_id)')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_reservations_status ON reservations(status)')
+        # Partial index over just the active rows: slot-occupancy lookups and
+        # consistency checks against is_available scan a handful of entries
+        # instead of the whole history
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_res_active_slot
+                               ON reservations(slot_id) WHERE status = 'active' ''')
+        # Same idea keyed by user: the one-active-reservation-per-user guard
+        # in the reservation workflow hits only live rows
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_res_active_user
+                               ON reservations(user_id) WHERE status = 'active' ''')
+        # Keyed by end time for the expiry sweep: the "active and past due"
+        # predicate becomes a range scan over only the live rows
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_reservations_active_end
+                               ON reservations(end_time) WHERE status = 'active' ''')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_user ON payments(user_id)')
+        # Newest-first index for the wallet-activity listing: the ORDER BY
+        # created_at DESC LIMIT walk reads the first rows of the index
+        # instead of sorting the whole table per dashboard poll
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_wallet_tx_created
+                               ON wallet_transactions(created_at DESC)''')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_payments_reservation ON payments(reservation_id)')
         self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_stats_slot_date ON utilization_stats(slot_id, date)')
+        # Aggregation indexes for the dashboards: the GROUP BY column leads
+        # and the aggregated columns trail, so the occupancy and revenue
+        # rollups run as index-only scans without touching the base tables
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_slots_floor_avail
+                               ON parking_slots(floor_number, is_available)''')
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_slots_zone_avail
+                               ON parking_slots(zone, is_available)
+                               WHERE zone IS NOT NULL''')
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_payments_status_date
+                               ON payments(payment_status, payment_date, amount)''')
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_stats_hour
+                               ON utilization_stats(hour, occupancy_count, revenue)''')
+        # Matches get_utilization_stats' newest-first ordering so the
+        # listing walks the index instead of sorting the whole table
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_stats_date_hour
+                               ON utilization_stats(date DESC, hour DESC)''')
         
         self.conn.commit()
-        self.close()
-        print("✓ Database initialized with optimized schema and indexes!")
+        # Refresh planner statistics so the optimizer picks the composite
+        # indexes over the older single-column ones
+        self.cursor.execute('ANALYZE')
+        logger.debug("Database initialized with optimized schema and indexes")
     
     # ===== MODULE 1: PARKING SLOT OPERATIONS =====
     
@@ -149,14 +499,51 @@ class SmartParkingSystem:
                 VALUES (?, ?, ?, ?, ?)
             ''', (slot_number, floor_number, zone, slot_type, price_per_hour))
             self.conn.commit()
-            self.close()
-            print(f"✓ Parking slot {slot_number} added successfully!")
+            self._invalidate_read_caches()
+            logger.debug("Parking slot %s added", slot_number)
             return True
         except sqlite3.IntegrityError:
-            print(f"✗ Error: Slot {slot_number} already exists!")
-            self.close()
+            # the failed INSERT opened an implicit write transaction on the
+            # persistent connection; roll it back or it stays open forever
+            self.conn.rollback()
+            logger.debug("Slot %s already exists", slot_number)
             return False
     
+    def add_parking_slots_bulk(self, rows: List[Tuple]) -> int:
+        """Insert many slots inside one transaction
+
+        Each row is (slot_number, floor_number, zone, slot_type,
+        price_per_hour). One commit covers the whole batch, so bulk
+        provisioning pays a single fsync instead of one per slot. Rows whose
+        slot_number already exists are skipped. Returns the insert count.
+        """
+        self.connect()
+        with self.conn:
+            before = self.conn.total_changes
+            self.cursor.executemany('''
+                INSERT OR IGNORE INTO parking_slots (slot_number, floor_number, zone, slot_type, price_per_hour)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            inserted = self.conn.total_changes - before
+        if inserted:
+            self._invalidate_read_caches()
+        return inserted
+
+    def register_users_bulk(self, rows: List[Tuple]) -> int:
+        """Register many users inside one transaction
+
+        Each row is (username, email, phone, vehicle_number, wallet_balance).
+        Rows clashing on username/email are skipped. Returns the insert count.
+        """
+        self.connect()
+        with self.conn:
+            before = self.conn.total_changes
+            self.cursor.executemany('''
+                INSERT OR IGNORE INTO users (username, email, phone, vehicle_number, wallet_balance)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            return self.conn.total_changes - before
+
     def update_slot_availability_realtime(self, slot_id: int, is_available: bool) -> bool:
         """Real-time slot availability update"""
         self.connect()
@@ -167,10 +554,10 @@ class SmartParkingSystem:
         ''', (is_available, slot_id))
         self.conn.commit()
         affected = self.cursor.rowcount
-        self.close()
         if affected > 0:
+            self._invalidate_read_caches()
             status = "available" if is_available else "occupied"
-            print(f"✓ Slot {slot_id} marked as {status}")
+            logger.debug("Slot %s marked as %s", slot_id, status)
         return affected > 0
     
     # ===== MODULE 1: USER OPERATIONS =====
@@ -186,12 +573,11 @@ class SmartParkingSystem:
                 VALUES (?, ?, ?, ?, ?)
             ''', (username, email, phone, vehicle_number, initial_balance))
             self.conn.commit()
-            self.close()
-            print(f"✓ User {username} registered successfully!")
+            logger.debug("User %s registered", username)
             return True
         except sqlite3.IntegrityError:
-            print(f"✗ Error: User {username} or email {email} already exists!")
-            self.close()
+            self.conn.rollback()
+            logger.debug("User %s or email %s already exists", username, email)
             return False
     
     def add_wallet_balance(self, user_id: int, amount: float) -> bool:
@@ -214,10 +600,10 @@ class SmartParkingSystem:
             ''', (user_id, amount))
 
         self.conn.commit()
-        self.close()
 
         if affected > 0:
-            print(f"✓ Added ${amount:.2f} to user {user_id} wallet")
+            self._invalidate_read_caches()
+            logger.debug("Added $%.2f to user %s wallet", amount, user_id)
         return affected > 0
     
     # ===== MODULE 2: QUERY OPTIMIZATION & SLOT SEARCH =====
@@ -226,104 +612,143 @@ class SmartParkingSystem:
                                         zone: str = None, slot_type: str = None,
                                         max_price: float = None) -> List[Tuple]:
         """Optimized search using indexes for fast retrieval"""
-        self.connect()
-        
-        query = 'SELECT * FROM parking_slots WHERE is_available = 1'
-        params = []
-        
-        if floor_number is not None:
-            query += ' AND floor_number = ?'
-            params.append(floor_number)
-        
-        if zone:
-            query += ' AND zone = ?'
-            params.append(zone)
-        
-        if slot_type:
-            query += ' AND slot_type = ?'
-            params.append(slot_type)
-        
-        if max_price is not None:
-            query += ' AND price_per_hour <= ?'
-            params.append(max_price)
-        
-        query += ' ORDER BY price_per_hour, floor_number, slot_number'
-        
-        self.cursor.execute(query, params)
-        available_slots = self.cursor.fetchall()
-        self.close()
+        self._check_external_writes()
+
+        cache_key = (floor_number, zone, slot_type, max_price)
+        cached = self._avail_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        query, params = self._build_slot_search(floor_number, zone, slot_type, max_price)
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        available_slots = cursor.fetchall()
+        self._avail_cache[cache_key] = available_slots
         return available_slots
-    
-    def get_availability_summary(self) -> Dict:
-        """Get comprehensive availability summary"""
-        # Release expired reservations before computing availability
-        self.release_expired_reservations()
 
+    @staticmethod
+    def _build_slot_search(floor_number=None, zone=None, slot_type=None, max_price=None):
+        """Look up the precompiled slot-search statement for the given filters"""
+        key = (floor_number is not None, bool(zone), bool(slot_type), max_price is not None)
+        candidates = (floor_number, zone, slot_type, max_price)
+        params = [value for value, used in zip(candidates, key) if used]
+        return _SLOT_SEARCH_SQL[key], params
+
+    def iter_available_slots(self, floor_number: int = None, zone: str = None,
+                             slot_type: str = None, max_price: float = None):
+        """Yield matching available slots without materializing the full list
+
+        Streams rows in fetchmany batches on a dedicated cursor, so exports
+        over large slot inventories hold at most one batch in memory. Results
+        are not cached; callers that want the cached list should use
+        search_available_slots_optimized.
+        """
         self.connect()
+        query, params = self._build_slot_search(floor_number, zone, slot_type, max_price)
 
-        # Total and available slots
-        self.cursor.execute('SELECT COUNT(*), SUM(CASE WHEN is_available = 1 THEN 1 ELSE 0 END) FROM parking_slots')
-        total, available = self.cursor.fetchone()
-        total = total or 0
-        available = available or 0
-        occupied = total - available if total else 0
+        cursor = self.conn.cursor()
+        cursor.arraysize = 256
+        cursor.execute(query, params)
+        while True:
+            batch = cursor.fetchmany()
+            if not batch:
+                break
+            yield from batch
+    
+    def search_available_slots_columnar(self, floor_number: int = None,
+                                       zone: str = None, slot_type: str = None,
+                                       max_price: float = None) -> Dict[str, List]:
+        """Columnar variant of the slot search returning one list per field
 
-        # By floor with pricing
-        self.cursor.execute('''
-            SELECT floor_number,
-                   COUNT(*) as total,
-                   SUM(CASE WHEN is_available = 1 THEN 1 ELSE 0 END) as available,
-                   AVG(price_per_hour) as avg_price
-            FROM parking_slots
-            GROUP BY floor_number
-            ORDER BY floor_number
-        ''')
-        by_floor_rows = self.cursor.fetchall()
+        Allocations scale with the number of fields instead of the number
+        of rows, which keeps large result sets cheap to build and serialize.
+        """
+        rows = self.search_available_slots_optimized(floor_number, zone, slot_type, max_price)
+        if not rows:
+            return {key: [] for key in ('id', 'number', 'floor', 'zone', 'type', 'available', 'price')}
+
+        ids, numbers, floors, zones, types, availability, prices = zip(*rows)
+        return {
+            'id': list(ids),
+            'number': list(numbers),
+            'floor': list(floors),
+            'zone': list(zones),
+            'type': list(types),
+            'available': [bool(value) for value in availability],
+            'price': [float(value) for value in prices]
+        }
+
+    def get_availability_summary(self) -> Dict:
+        """Get comprehensive availability summary
 
-        # By zone
+        This is a pure read: expiry of overdue reservations is handled by
+        the caller's periodic release_expired_reservations sweep (the web
+        layer runs one on a background thread), so dashboard reads never
+        open a write transaction or queue behind the WAL writer lock.
+        """
+        self._check_external_writes()
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        # One scan over parking_slots grouped at (floor, zone) granularity;
+        # the floor and zone rollups plus the facility totals all derive
+        # from these cells in Python. SQLite lacks GROUPING SETS, so the
+        # finest grouping plus additive aggregates stands in for it.
         self.cursor.execute('''
-            SELECT zone,
-                   COUNT(*) as total,
-                   SUM(CASE WHEN is_available = 1 THEN 1 ELSE 0 END) as available
+            SELECT floor_number, zone,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE is_available = 1) AS available,
+                   SUM(price_per_hour) AS price_sum
             FROM parking_slots
-            WHERE zone IS NOT NULL
-            GROUP BY zone
-            ORDER BY zone
+            GROUP BY floor_number, zone
         ''')
-        by_zone_rows = self.cursor.fetchall()
+        cells = self.cursor.fetchall()
 
-        self.close()
+        total = 0
+        available = 0
+        floor_acc = {}
+        zone_acc = {}
+        for floor_number, zone, cell_total, cell_available, price_sum in cells:
+            total += cell_total
+            available += cell_available
+            floor_total, floor_available, floor_price = floor_acc.get(floor_number, (0, 0, 0.0))
+            floor_acc[floor_number] = (floor_total + cell_total,
+                                       floor_available + cell_available,
+                                       floor_price + (price_sum or 0))
+            if zone is not None:
+                zone_total, zone_available = zone_acc.get(zone, (0, 0))
+                zone_acc[zone] = (zone_total + cell_total, zone_available + cell_available)
 
         by_floor = []
-        for floor in by_floor_rows:
-            total_floor = floor[1] or 0
-            available_floor = floor[2] or 0
+        for floor_number in sorted(floor_acc):
+            total_floor, available_floor, price_sum = floor_acc[floor_number]
             occupied_floor = total_floor - available_floor
             rate = round((occupied_floor / total_floor * 100) if total_floor else 0, 2)
             by_floor.append({
-                'floor': floor[0],
+                'floor': floor_number,
                 'total': total_floor,
                 'available': available_floor,
                 'occupied': occupied_floor,
-                'avg_price': float(floor[3] or 0),
+                'avg_price': float(price_sum / total_floor) if total_floor else 0.0,
                 'occupancy_rate': rate
             })
 
         by_zone = []
-        for zone in by_zone_rows:
-            total_zone = zone[1] or 0
-            available_zone = zone[2] or 0
+        for zone_name in sorted(zone_acc):
+            total_zone, available_zone = zone_acc[zone_name]
             occupied_zone = total_zone - available_zone
             rate = round((occupied_zone / total_zone * 100) if total_zone else 0, 2)
             by_zone.append({
-                'zone': zone[0],
+                'zone': zone_name,
                 'total': total_zone,
                 'available': available_zone,
                 'occupied': occupied_zone,
                 'occupancy_rate': rate
             })
 
-        return {
+        occupied = total - available
+        self._summary_cache = {
             'total_slots': total,
             'available_slots': available,
             'occupied_slots': occupied,
@@ -331,6 +756,7 @@ class SmartParkingSystem:
             'by_floor': by_floor,
             'by_zone': by_zone
         }
+        return self._summary_cache
     
     # ===== MODULE 3: RESERVATION WORKFLOW =====
     
@@ -347,149 +773,126 @@ class SmartParkingSystem:
         if duration_hours < 1 or duration_hours > 4:
             return None, "Reservation duration must be between 1 and 4 hours."
 
-        self.connect()
         try:
-            # Begin transaction
-            self.conn.execute('BEGIN')
+            with self._tx_immediate():
+                # Claim the slot with a conditional UPDATE instead of a
+                # check-then-act pair; RETURNING hands back the hourly rate
+                # in the same statement, so claim and price fetch are one
+                # roundtrip.
+                self.cursor.execute(_SQL_CLAIM_SLOT, (slot_id,))
+                claimed = self.cursor.fetchone()
+                if claimed is None:
+                    logger.debug("Slot %s is not available", slot_id)
+                    raise _AbortTransaction("Parking slot is not available.")
 
-            # Ensure user does not have another active reservation
-            self.cursor.execute('''
-                SELECT reservation_id FROM reservations
-                WHERE user_id = ? AND status = 'active'
-            ''', (user_id,))
-            if self.cursor.fetchone():
-                self.conn.rollback()
-                self.close()
-                return None, "You already have an active reservation."
-
-            # Check slot availability
-            self.cursor.execute('SELECT is_available, price_per_hour FROM parking_slots WHERE slot_id = ?', (slot_id,))
-            result = self.cursor.fetchone()
-
-            if not result or not result[0]:
-                print("✗ Error: Parking slot is not available!")
-                self.conn.rollback()
-                self.close()
-                return None, "Parking slot is not available."
-            
-            price_per_hour = result[1]
-            total_amount = price_per_hour * duration_hours
-            
-            # Check user wallet balance
-            self.cursor.execute('SELECT wallet_balance FROM users WHERE user_id = ?', (user_id,))
-            balance = self.cursor.fetchone()
-            
-            if not balance or balance[0] < total_amount:
-                print(f"✗ Error: Insufficient wallet balance! Need ${total_amount:.2f}, have ${balance[0] if balance else 0:.2f}")
-                self.conn.rollback()
-                self.close()
-                return None, "Insufficient wallet balance."
-            
-            # Create reservation
-            start_time = datetime.now()
-            end_time = start_time + timedelta(hours=duration_hours)
-            
-            self.cursor.execute('''
-                INSERT INTO reservations (user_id, slot_id, start_time, end_time, duration_hours, total_amount, payment_status, status)
-                VALUES (?, ?, ?, ?, ?, ?, 'completed', 'active')
-            ''', (user_id, slot_id, start_time.isoformat(), end_time.isoformat(), duration_hours, total_amount))
-            
-            reservation_id = self.cursor.lastrowid
-            
-            # Process payment - deduct from wallet
-            self.cursor.execute('''
-                UPDATE users 
-                SET wallet_balance = wallet_balance - ? 
-                WHERE user_id = ? AND wallet_balance >= ?
-            ''', (total_amount, user_id, total_amount))
-            
-            if self.cursor.rowcount == 0:
-                print(f"✗ Error: Payment failed - concurrent balance change detected")
-                self.conn.rollback()
-                self.close()
-                return None, "Payment failed due to concurrent balance change."
-
-            # Record wallet debit
-            self.cursor.execute('''
-                INSERT INTO wallet_transactions (user_id, amount, transaction_type, description)
-                VALUES (?, ?, 'debit', 'Reservation payment')
-            ''', (user_id, -total_amount))
-            
-            # Record payment
-            transaction_id = f"TXN{datetime.now().strftime('%Y%m%d%H%M%S')}{reservation_id}"
-            self.cursor.execute('''
-                INSERT INTO payments (reservation_id, user_id, amount, payment_method, transaction_id, payment_status)
-                VALUES (?, ?, ?, ?, ?, 'completed')
-            ''', (reservation_id, user_id, total_amount, payment_method, transaction_id))
-            
-            # Update slot availability
-            self.cursor.execute('UPDATE parking_slots SET is_available = 0 WHERE slot_id = ?', (slot_id,))
-            
-            # Record utilization stats with correct UPSERT
-            current_date = datetime.now().date()
-            current_hour = datetime.now().hour
-            self.cursor.execute('''
-                INSERT INTO utilization_stats (slot_id, date, hour, occupancy_count, revenue)
-                VALUES (?, ?, ?, 1, ?)
-                ON CONFLICT(slot_id, date, hour) DO UPDATE SET 
-                    occupancy_count = occupancy_count + 1,
-                    revenue = revenue + ?
-            ''', (slot_id, current_date, current_hour, total_amount, total_amount))
-            
-            # Commit transaction
-            self.conn.commit()
-            self.close()
-            print(f"✓ Reservation {reservation_id} created! Amount: ${total_amount:.2f}, Duration: {duration_hours}h")
-            print(f"✓ Payment processed: {transaction_id}")
-            return reservation_id, "Reservation created successfully."
+                price_per_hour = claimed[0]
+                total_amount = price_per_hour * duration_hours
+
+                # Deduct the payment; the WHERE clause gates on both the
+                # balance and the one-active-reservation rule, so the happy
+                # path spends one statement where it used to spend three.
+                # The failure branch re-checks only to pick the message.
+                self.cursor.execute(_SQL_DEDUCT_WALLET,
+                                    (total_amount, user_id, total_amount, user_id))
+
+                if self.cursor.rowcount == 0:
+                    self.cursor.execute(_SQL_ACTIVE_RES_FOR_USER, (user_id,))
+                    if self.cursor.fetchone():
+                        raise _AbortTransaction("You already have an active reservation.")
+                    logger.debug("Insufficient wallet balance: need $%.2f for user %s",
+                                 total_amount, user_id)
+                    raise _AbortTransaction("Insufficient wallet balance.")
+
+                # One clock read covers the whole transaction so the
+                # reservation window, transaction id, and stats bucket agree
+                now = datetime.now()
+                start_time = now
+                end_time = start_time + timedelta(hours=duration_hours)
+
+                # RETURNING (SQLite >= 3.35) hands back the new id with the
+                # insert itself, so no follow-up lastrowid lookup is needed
+                self.cursor.execute(_SQL_INSERT_RESERVATION,
+                                    (user_id, slot_id, start_time.isoformat(), end_time.isoformat(),
+                                     duration_hours, total_amount))
+
+                reservation_id = self.cursor.fetchone()[0]
+
+                # Record wallet debit
+                self.cursor.execute(_SQL_INSERT_WALLET_DEBIT, (user_id, -total_amount))
+
+                # Record payment; the TXN id is synthesized inside the
+                # statement with printf, so the fully-prepared insert is
+                # reused from the statement cache with no Python strftime
+                self.cursor.execute(_SQL_INSERT_PAYMENT,
+                                    (reservation_id, user_id, total_amount, payment_method, reservation_id))
+                transaction_id = self.cursor.fetchone()[0]
+
+        except _AbortTransaction as abort:
+            return None, str(abort)
         except Exception as e:
-            print(f"✗ Error creating reservation: {e}")
-            if self.conn:
-                self.conn.rollback()
-            self.close()
+            logger.exception("Error creating reservation: %s", e)
             return None, "An unexpected error occurred while creating the reservation."
+
+        # Utilization stats are written behind: buffer the increment and
+        # flush batched once the interval or bucket threshold is reached
+        self._buffer_stat(slot_id, now.date().isoformat(), now.hour, total_amount)
+
+        self._invalidate_read_caches()
+        logger.debug("Reservation %s created: $%.2f for %sh", reservation_id, total_amount, duration_hours)
+        logger.debug("Payment processed: %s", transaction_id)
+        return reservation_id, "Reservation created successfully."
+
+    def _buffer_stat(self, slot_id: int, date: str, hour: int, amount: float):
+        """Accumulate a utilization increment, flushing when due"""
+        key = (slot_id, date, hour)
+        count, revenue = self._stats_buffer.get(key, (0, 0.0))
+        self._stats_buffer[key] = (count + 1, revenue + amount)
+        if (len(self._stats_buffer) >= _STATS_FLUSH_MAX
+                or time.monotonic() - self._stats_last_flush >= _STATS_FLUSH_INTERVAL):
+            self.flush_stats()
+
+    def flush_stats(self):
+        """Write all buffered utilization increments in one batched UPSERT"""
+        if not self._stats_buffer:
+            self._stats_last_flush = time.monotonic()
+            return
+        rows = [(slot_id, date, hour, count, revenue)
+                for (slot_id, date, hour), (count, revenue) in self._stats_buffer.items()]
+        self.connect()
+        with self.conn:
+            self.cursor.executemany(_SQL_UPSERT_STATS, rows)
+        self._stats_buffer.clear()
+        self._stats_last_flush = time.monotonic()
     
     def end_reservation(self, reservation_id: int) -> bool:
         """End reservation and free up the slot"""
         try:
-            self.connect()
-            
-            self.cursor.execute('SELECT slot_id FROM reservations WHERE reservation_id = ?', (reservation_id,))
-            result = self.cursor.fetchone()
-            
-            if not result:
-                print("✗ Error: Reservation not found!")
-                self.close()
-                return False
-            
-            slot_id = result[0]
-            
-            self.cursor.execute('''
-                UPDATE reservations 
-                SET status = 'completed', end_time = ?
-                WHERE reservation_id = ?
-            ''', (datetime.now().isoformat(), reservation_id))
-            
-            self.cursor.execute('UPDATE parking_slots SET is_available = 1 WHERE slot_id = ?', (slot_id,))
-            
-            self.conn.commit()
-            self.close()
-            print(f"✓ Reservation {reservation_id} ended and slot {slot_id} is now available!")
-            return True
+            with self._tx_immediate():
+                # The slot UPDATE drives off the reservation row directly;
+                # RETURNING doubles as the existence check, replacing the
+                # old SELECT-then-UPDATE pair
+                self.cursor.execute(_SQL_FREE_SLOT_FOR_RESERVATION, (reservation_id,))
+                freed = self.cursor.fetchone()
+
+                if freed is None:
+                    logger.debug("Reservation %s not found", reservation_id)
+                    raise _AbortTransaction("Reservation not found.")
+
+                slot_id = freed[0]
+
+                self.cursor.execute(_SQL_COMPLETE_RESERVATION, (datetime.now().isoformat(), reservation_id))
+        except _AbortTransaction:
+            return False
         except Exception as e:
-            print(f"✗ Error ending reservation: {e}")
-            self.close()
+            logger.exception("Error ending reservation: %s", e)
             return False
 
-    def get_user_by_id(self, user_id: int) -> Optional[Dict]:
-        """Return user information as a dictionary"""
-        self.connect()
-        self.cursor.execute('''
-            SELECT user_id, username, email, phone, vehicle_number, wallet_balance, created_at
-            FROM users WHERE user_id = ?
-        ''', (user_id,))
-        row = self.cursor.fetchone()
-        self.close()
+        self._invalidate_read_caches()
+        logger.debug("Reservation %s ended, slot %s available", reservation_id, slot_id)
+        return True
+
+    @staticmethod
+    def _map_user_row(row) -> Optional[Dict]:
         if not row:
             return None
         return {
@@ -498,270 +901,281 @@ class SmartParkingSystem:
             'email': row[2],
             'phone': row[3],
             'vehicle_number': row[4],
-            'wallet_balance': float(row[5] or 0),
+            'wallet_balance': row[5],
             'created_at': row[6]
         }
 
-    def get_user_reservations(self, user_id: int, active_only: bool = False) -> List[Dict]:
-        """Fetch reservations for a specific user"""
-        self.connect()
+    @staticmethod
+    def _map_reservation_rows(rows) -> List[Dict]:
+        return [{
+            'reservation_id': row[0],
+            'slot_number': row[1],
+            'start_time': row[2],
+            'duration_hours': row[3],
+            'status': row[4]
+        } for row in rows]
+
+    def _query_user(self, user_id: int):
+        # Nullable numerics are coerced in the projection so no per-row
+        # branch-and-cast runs in Python during mapping
+        self.cursor.execute('''
+            SELECT user_id, username, email, phone, vehicle_number,
+                   CAST(COALESCE(wallet_balance, 0) AS REAL) AS wallet_balance,
+                   created_at
+            FROM users WHERE user_id = ?
+        ''', (user_id,))
+        return self.cursor.fetchone()
+
+    @staticmethod
+    def _user_reservations_sql(active_only: bool = False, limit: Optional[int] = None):
         query = '''
-            SELECT r.reservation_id, p.slot_number, r.start_time, r.duration_hours, r.status
+            SELECT r.reservation_id, p.slot_number, r.start_time,
+                   CAST(COALESCE(r.duration_hours, 0) AS REAL) AS duration_hours,
+                   r.status
             FROM reservations r
             JOIN parking_slots p ON r.slot_id = p.slot_id
             WHERE r.user_id = ?
         '''
-        params = [user_id]
         if active_only:
             query += " AND r.status = 'active'"
         query += ' ORDER BY r.start_time DESC'
-        self.cursor.execute(query, params)
-        rows = self.cursor.fetchall()
-        self.close()
+        if limit is not None:
+            query += ' LIMIT ?'
+        return query
 
-        reservations = []
-        for row in rows:
-            reservations.append({
-                'reservation_id': row[0],
-                'slot_number': row[1],
-                'start_time': row[2],
-                'duration_hours': float(row[3] or 0),
-                'status': row[4]
-            })
-        return reservations
+    def _query_user_reservations(self, user_id: int, active_only: bool = False,
+                                 limit: Optional[int] = None):
+        params = [user_id] if limit is None else [user_id, limit]
+        self.cursor.execute(self._user_reservations_sql(active_only, limit), params)
+        return self.cursor.fetchall()
+
+    def get_user_by_id(self, user_id: int) -> Optional[Dict]:
+        """Return user information as a dictionary"""
+        self.connect()
+        row = self._query_user(user_id)
+        return self._map_user_row(row)
+
+    def get_user_reservations(self, user_id: int, active_only: bool = False,
+                              limit: Optional[int] = None) -> List[Dict]:
+        """Fetch reservations for a specific user, newest first
+
+        An optional limit bounds the list for paginated views; it is
+        pushed into the SQL so SQLite stops walking the covering index
+        after that many rows.
+        """
+        self.connect()
+        rows = self._query_user_reservations(user_id, active_only, limit)
+        return self._map_reservation_rows(rows)
+
+    def iter_user_reservations(self, user_id: int, active_only: bool = False,
+                               limit: Optional[int] = None):
+        """Yield a user's reservations one dict at a time, newest first
+
+        Streaming counterpart of get_user_reservations for long histories:
+        rows come off a dedicated cursor in fetchmany batches, so exports
+        hold one batch in memory and callers can break early without
+        paying for the rest.
+        """
+        self.connect()
+        cursor = self.conn.cursor()
+        cursor.arraysize = 256
+        params = [user_id] if limit is None else [user_id, limit]
+        cursor.execute(self._user_reservations_sql(active_only, limit), params)
+        while True:
+            batch = cursor.fetchmany()
+            if not batch:
+                break
+            yield from self._map_reservation_rows(batch)
+
+    def get_user_with_reservations(self, user_id: int,
+                                  active_only: bool = False) -> Tuple[Optional[Dict], List[Dict]]:
+        """Fetch a user and their reservations over one connection
+
+        Profile views need both; issuing the two queries back-to-back on a
+        single connection halves the round-trips of calling the individual
+        getters.
+        """
+        self.connect()
+        user_row = self._query_user(user_id)
+        rows = self._query_user_reservations(user_id, active_only) if user_row else []
+        return self._map_user_row(user_row), self._map_reservation_rows(rows)
 
     def get_active_reservations(self) -> List[Dict]:
         """Return a list of active reservations with user and slot details"""
         self.connect()
-        self.cursor.execute('''
+        # Selected names match the output keys, so each row dictifies in
+        # one C-level dict(row) call instead of a hand-built literal, and
+        # iterating the cursor skips the intermediate fetchall list
+        return [dict(row) for row in self.cursor.execute('''
             SELECT r.reservation_id, u.username, p.slot_number, r.start_time, r.end_time
             FROM reservations r
             JOIN users u ON r.user_id = u.user_id
             JOIN parking_slots p ON r.slot_id = p.slot_id
             WHERE r.status = 'active'
-        ''')
-        rows = self.cursor.fetchall()
-        self.close()
-        active = []
-        for row in rows:
-            active.append({
-                'reservation_id': row[0],
-                'username': row[1],
-                'slot_number': row[2],
-                'start_time': row[3],
-                'end_time': row[4]
-            })
-        return active
+        ''')]
 
     def release_expired_reservations(self) -> int:
-        """Mark reservations whose end time has passed as completed and free the slot"""
-        self.connect()
-        now = datetime.now().isoformat()
-        self.cursor.execute('''
-            SELECT reservation_id, slot_id FROM reservations
-            WHERE status = 'active' AND end_time <= ?
-        ''', (now,))
-        expired = self.cursor.fetchall()
+        """Mark reservations whose end time has passed as completed and free the slot
 
-        released = 0
-        for reservation_id, slot_id in expired:
-            self.cursor.execute('''
-                UPDATE reservations
-                SET status = 'completed', end_time = ?
-                WHERE reservation_id = ?
-            ''', (now, reservation_id))
-            self.cursor.execute('UPDATE parking_slots SET is_available = 1 WHERE slot_id = ?', (slot_id,))
-            released += 1
+        The sweep is two set-based UPDATEs in one transaction: however many
+        reservations expired, SQLite retires exactly two statements instead
+        of a SELECT plus two UPDATEs per row. The slot update runs first
+        while the expired rows are still flagged active.
+        """
+        now = datetime.now().isoformat()
+        with self._tx_immediate():
+            self.cursor.execute(_SQL_RELEASE_EXPIRED_SLOTS, (now,))
+            self.cursor.execute(_SQL_RELEASE_EXPIRED_RES, (now, now))
+            released = self.cursor.rowcount
 
         if released:
-            self.conn.commit()
-        self.close()
+            self._invalidate_read_caches()
         return released
 
     def get_occupancy_by_floor(self) -> List[Dict]:
-        """Return occupancy rate per floor"""
-        self.connect()
-        self.cursor.execute('''
-            SELECT floor_number,
+        """Return occupancy rate per floor
+
+        The rate is computed inside the SELECT; COUNT(*) in a GROUP BY
+        group is never zero, so no divide-by-zero guard is needed and the
+        rows dictify straight off the aliased columns.
+        """
+        self._check_external_writes()
+        cached = self._analytics_cache.get('occ_floor')
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+        result = [dict(row) for row in self.cursor.execute('''
+            SELECT floor_number AS floor,
                    COUNT(*) AS total,
-                   SUM(CASE WHEN is_available = 0 THEN 1 ELSE 0 END) AS occupied
+                   COUNT(*) FILTER (WHERE is_available = 0) AS occupied,
+                   ROUND(100.0 * COUNT(*) FILTER (WHERE is_available = 0) / COUNT(*), 2) AS occupancy_rate
             FROM parking_slots
             GROUP BY floor_number
             ORDER BY floor_number
-        ''')
-        rows = self.cursor.fetchall()
-        self.close()
-        floors = []
-        for row in rows:
-            total = row[1] or 0
-            occupied = row[2] or 0
-            rate = round((occupied / total * 100) if total else 0, 2)
-            floors.append({
-                'floor': row[0],
-                'total': total,
-                'occupied': occupied,
-                'occupancy_rate': rate
-            })
-        return floors
+        ''')]
+        self._analytics_cache['occ_floor'] = (self._gen, result)
+        return result
 
     def get_occupancy_by_zone(self) -> List[Dict]:
         """Return occupancy rate per zone"""
-        self.connect()
-        self.cursor.execute('''
+        self._check_external_writes()
+        cached = self._analytics_cache.get('occ_zone')
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+        result = [dict(row) for row in self.cursor.execute('''
             SELECT zone,
                    COUNT(*) AS total,
-                   SUM(CASE WHEN is_available = 0 THEN 1 ELSE 0 END) AS occupied
+                   COUNT(*) FILTER (WHERE is_available = 0) AS occupied,
+                   ROUND(100.0 * COUNT(*) FILTER (WHERE is_available = 0) / COUNT(*), 2) AS occupancy_rate
             FROM parking_slots
             WHERE zone IS NOT NULL
             GROUP BY zone
             ORDER BY zone
-        ''')
-        rows = self.cursor.fetchall()
-        self.close()
-        zones = []
-        for row in rows:
-            total = row[1] or 0
-            occupied = row[2] or 0
-            rate = round((occupied / total * 100) if total else 0, 2)
-            zones.append({
-                'zone': row[0],
-                'total': total,
-                'occupied': occupied,
-                'occupancy_rate': rate
-            })
-        return zones
+        ''')]
+        self._analytics_cache['occ_zone'] = (self._gen, result)
+        return result
 
     def get_wallet_transactions(self, limit: int = 10) -> List[Dict]:
         """Return latest wallet transactions"""
-        self.connect()
-        self.cursor.execute('''
-            SELECT wt.transaction_id, wt.user_id, u.username, wt.amount, wt.transaction_type, wt.created_at
+        self._check_external_writes()
+        cached = self._analytics_cache.get(('wallet', limit))
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+        result = [dict(row) for row in self.cursor.execute('''
+            SELECT wt.transaction_id, wt.user_id, u.username,
+                   CAST(COALESCE(wt.amount, 0) AS REAL) AS amount,
+                   wt.transaction_type, wt.created_at
             FROM wallet_transactions wt
             JOIN users u ON wt.user_id = u.user_id
             ORDER BY wt.created_at DESC
             LIMIT ?
-        ''', (limit,))
-        rows = self.cursor.fetchall()
-        self.close()
-        transactions = []
-        for row in rows:
-            transactions.append({
-                'transaction_id': row[0],
-                'user_id': row[1],
-                'username': row[2],
-                'amount': float(row[3] or 0),
-                'transaction_type': row[4],
-                'created_at': row[5]
-            })
-        return transactions
+        ''', (limit,))]
+        self._analytics_cache[('wallet', limit)] = (self._gen, result)
+        return result
     
     # ===== MODULE 3: ANALYTICS & PREDICTIONS =====
     
     def get_utilization_stats(self, slot_id: int = None, date: str = None) -> List[Tuple]:
         """Get parking slot utilization statistics"""
+        self.flush_stats()
         self.connect()
-        
-        query = 'SELECT * FROM utilization_stats WHERE 1=1'
-        params = []
-        
-        if slot_id:
-            query += ' AND slot_id = ?'
-            params.append(slot_id)
-        
-        if date:
-            query += ' AND date = ?'
-            params.append(date)
-        
-        query += ' ORDER BY date DESC, hour DESC'
-        
-        self.cursor.execute(query, params)
-        stats = self.cursor.fetchall()
-        self.close()
-        return stats
+
+        key = (slot_id is not None, date is not None)
+        params = [value for value in (slot_id, date) if value is not None]
+        self.cursor.execute(_UTIL_STATS_SQL[key], params)
+        return self.cursor.fetchall()
     
     def predict_peak_demand(self) -> Dict:
         """Predict peak demand hours based on historical data"""
-        self.connect()
-        
-        # Get hourly occupancy patterns
-        self.cursor.execute('''
-            SELECT hour, AVG(occupancy_count) as avg_occupancy, SUM(revenue) as total_revenue
-            FROM utilization_stats
-            GROUP BY hour
-            ORDER BY avg_occupancy DESC
-        ''')
-        hourly_stats = self.cursor.fetchall()
-        
-        # Get busiest zones
-        self.cursor.execute('''
-            SELECT p.zone, COUNT(r.reservation_id) as reservation_count, SUM(r.total_amount) as total_revenue
-            FROM reservations r
-            JOIN parking_slots p ON r.slot_id = p.slot_id
-            WHERE p.zone IS NOT NULL
-            GROUP BY p.zone
-            ORDER BY reservation_count DESC
-        ''')
-        zone_stats = self.cursor.fetchall()
-        
-        # Get slot type preferences
-        self.cursor.execute('''
-            SELECT p.slot_type, COUNT(r.reservation_id) as reservation_count
-            FROM reservations r
-            JOIN parking_slots p ON r.slot_id = p.slot_id
-            GROUP BY p.slot_type
-            ORDER BY reservation_count DESC
-        ''')
-        type_stats = self.cursor.fetchall()
-        
-        self.close()
-        
-        peak_hours = [stat[0] for stat in hourly_stats[:3]] if hourly_stats else []
-        
-        return {
+        self._check_external_writes()
+        cached = self._analytics_cache.get('peak_demand')
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+
+        self.flush_stats()
+
+        # Hourly patterns, busiest zones and slot-type preferences come
+        # back from one fused statement; rows are partitioned by their tag
+        # and materialized as plain tuples because they go straight into
+        # JSON payloads and templates that index them positionally. The
+        # UNION ALL forbids per-branch ORDER BY, so each list is sorted
+        # here (they are at most a few dozen rows).
+        hourly_stats = []
+        zone_stats = []
+        type_stats = []
+        for row in self.cursor.execute(_SQL_PEAK_DEMAND):
+            if row[0] == 'hour':
+                hourly_stats.append((row[1], row[2], row[3]))
+            elif row[0] == 'zone':
+                zone_stats.append((row[1], row[2], row[3]))
+            else:
+                type_stats.append((row[1], row[2]))
+        hourly_stats.sort(key=lambda stat: stat[1], reverse=True)
+        zone_stats.sort(key=lambda stat: stat[1], reverse=True)
+        type_stats.sort(key=lambda stat: stat[1], reverse=True)
+
+        # hourly_stats is already sorted busiest-first, so the peak hours
+        # are simply its head
+        peak_hours = [stat[0] for stat in hourly_stats[:3]]
+
+        result = {
             'peak_hours': peak_hours,
             'hourly_patterns': hourly_stats,
             'busiest_zones': zone_stats,
             'slot_type_preferences': type_stats,
             'recommendation': f"Peak demand expected at hours: {', '.join(map(str, peak_hours))}" if peak_hours else "Insufficient data for prediction"
         }
+        self._analytics_cache['peak_demand'] = (self._gen, result)
+        return result
     
     def get_revenue_report(self) -> Dict:
         """Generate revenue report"""
-        self.connect()
-        
-        # Total revenue
-        self.cursor.execute('SELECT SUM(amount) FROM payments WHERE payment_status = "completed"')
-        total_revenue = self.cursor.fetchone()[0] or 0
-        
-        # Revenue by date
-        self.cursor.execute('''
-            SELECT DATE(payment_date) as date, SUM(amount) as daily_revenue
-            FROM payments
-            WHERE payment_status = "completed"
-            GROUP BY DATE(payment_date)
-            ORDER BY date DESC
-            LIMIT 7
-        ''')
-        daily_revenue = self.cursor.fetchall()
-        
-        # Revenue by slot type
-        self.cursor.execute('''
-            SELECT p.slot_type, SUM(pay.amount) as revenue
-            FROM payments pay
-            JOIN reservations r ON pay.reservation_id = r.reservation_id
-            JOIN parking_slots p ON r.slot_id = p.slot_id
-            WHERE pay.payment_status = "completed"
-            GROUP BY p.slot_type
-        ''')
-        revenue_by_type = self.cursor.fetchall()
-        
-        self.close()
-        
-        return {
+        self._check_external_writes()
+        cached = self._analytics_cache.get('revenue_report')
+        if cached is not None and cached[0] == self._gen:
+            return cached[1]
+
+        # One fused statement returns all three sections tagged; rows are
+        # partitioned here and kept as plain tuples for the templates and
+        # JSON payloads that index them positionally
+        total_revenue = 0
+        daily_revenue = []
+        revenue_by_type = []
+        for row in self.cursor.execute(_SQL_REVENUE_REPORT):
+            if row[0] == 'total':
+                total_revenue = row[2] or 0
+            elif row[0] == 'daily':
+                daily_revenue.append((row[1], row[2]))
+            else:
+                revenue_by_type.append((row[1], row[2]))
+        daily_revenue.sort(reverse=True)
+
+        result = {
             'total_revenue': total_revenue,
             'daily_revenue': daily_revenue,
             'revenue_by_slot_type': revenue_by_type
         }
+        self._analytics_cache['revenue_report'] = (self._gen, result)
+        return result
 
 
 def main():
@@ -779,22 +1193,28 @@ def main():
     
     print("\n1.1 Creating Parking Slots with Dynamic Pricing...")
     print("-" * 80)
-    parking.add_parking_slot("A-101", 1, "Zone A", "regular", 5.00)
-    parking.add_parking_slot("A-102", 1, "Zone A", "regular", 5.00)
-    parking.add_parking_slot("A-103", 1, "Zone A", "handicap", 3.00)
-    parking.add_parking_slot("A-104", 1, "Zone A", "regular", 5.00)
-    parking.add_parking_slot("B-201", 2, "Zone B", "regular", 6.00)
-    parking.add_parking_slot("B-202", 2, "Zone B", "vip", 10.00)
-    parking.add_parking_slot("B-203", 2, "Zone B", "regular", 6.00)
-    parking.add_parking_slot("C-301", 3, "Zone C", "regular", 7.00)
-    parking.add_parking_slot("C-302", 3, "Zone C", "electric", 8.00)
-    parking.add_parking_slot("C-303", 3, "Zone C", "regular", 7.00)
-    
+    added = parking.add_parking_slots_bulk([
+        ("A-101", 1, "Zone A", "regular", 5.00),
+        ("A-102", 1, "Zone A", "regular", 5.00),
+        ("A-103", 1, "Zone A", "handicap", 3.00),
+        ("A-104", 1, "Zone A", "regular", 5.00),
+        ("B-201", 2, "Zone B", "regular", 6.00),
+        ("B-202", 2, "Zone B", "vip", 10.00),
+        ("B-203", 2, "Zone B", "regular", 6.00),
+        ("C-301", 3, "Zone C", "regular", 7.00),
+        ("C-302", 3, "Zone C", "electric", 8.00),
+        ("C-303", 3, "Zone C", "regular", 7.00)
+    ])
+    print(f"✓ {added} parking slots added in one transaction")
+
     print("\n1.2 Registering Users with Wallet...")
     print("-" * 80)
-    parking.register_user("john_doe", "john@example.com", "1234567890", "ABC-1234", 100.00)
-    parking.register_user("jane_smith", "jane@example.com", "0987654321", "XYZ-5678", 150.00)
-    parking.register_user("bob_wilson", "bob@example.com", "5555555555", "DEF-9999", 75.00)
+    registered = parking.register_users_bulk([
+        ("john_doe", "john@example.com", "1234567890", "ABC-1234", 100.00),
+        ("jane_smith", "jane@example.com", "0987654321", "XYZ-5678", 150.00),
+        ("bob_wilson", "bob@example.com", "5555555555", "DEF-9999", 75.00)
+    ])
+    print(f"✓ {registered} users registered in one transaction")
     
     print("\n" + "=" * 80)
     print("MODULE 2: QUERY OPTIMIZATION & SLOT SEARCH")
@@ -804,22 +1224,28 @@ def main():
     print("-" * 80)
     available = parking.search_available_slots_optimized()
     if available:
-        print(f"{'ID':<5} {'Slot':<10} {'Floor':<7} {'Zone':<10} {'Type':<12} {'Price/hr':<10}")
-        print("-" * 80)
-        for slot in available:
-            print(f"{slot[0]:<5} {slot[1]:<10} {slot[2]:<7} {slot[3] or 'N/A':<10} {slot[4]:<12} ${slot[6]:<9.2f}")
+        # One buffered write for the whole table instead of a flush per row;
+        # keeps the demo usable as a micro-benchmark on large inventories
+        header = f"{'ID':<5} {'Slot':<10} {'Floor':<7} {'Zone':<10} {'Type':<12} {'Price/hr':<10}\n" + "-" * 80
+        body = "\n".join(
+            f"{slot['slot_id']:<5} {slot['slot_number']:<10} {slot['floor_number']:<7} "
+            f"{slot['zone'] or 'N/A':<10} {slot['slot_type']:<12} ${slot['price_per_hour']:<9.2f}"
+            for slot in available
+        )
+        sys.stdout.write(header + "\n" + body + "\n")
     
     print("\n2.2 Optimized Search - Zone A Only:")
     print("-" * 80)
     zone_a = parking.search_available_slots_optimized(zone="Zone A")
     for slot in zone_a:
-        print(f"  Slot {slot[1]}: {slot[4]} - ${slot[6]:.2f}/hour")
+        print(f"  Slot {slot['slot_number']}: {slot['slot_type']} - ${slot['price_per_hour']:.2f}/hour")
     
     print("\n2.3 Optimized Search - Budget Slots (≤$6/hour):")
     print("-" * 80)
     budget = parking.search_available_slots_optimized(max_price=6.00)
     for slot in budget:
-        print(f"  Slot {slot[1]}: Floor {slot[2]}, {slot[4]} - ${slot[6]:.2f}/hour")
+        print(f"  Slot {slot['slot_number']}: Floor {slot['floor_number']}, "
+              f"{slot['slot_type']} - ${slot['price_per_hour']:.2f}/hour")
     
     print("\n2.4 Availability Summary:")
     print("-" * 80)
@@ -830,10 +1256,10 @@ def main():
     print(f"Occupancy Rate: {summary['occupancy_rate']}%")
     print("\nBy Floor:")
     for floor in summary['by_floor']:
-        print(f"  Floor {floor[0]}: {int(floor[2]) if floor[2] else 0}/{floor[1]} available (Avg: ${floor[3]:.2f}/hr)")
+        print(f"  Floor {floor['floor']}: {floor['available']}/{floor['total']} available (Avg: ${floor['avg_price']:.2f}/hr)")
     print("\nBy Zone:")
     for zone in summary['by_zone']:
-        print(f"  {zone[0]}: {int(zone[2]) if zone[2] else 0}/{zone[1]} available")
+        print(f"  {zone['zone']}: {zone['available']}/{zone['total']} available")
     
     print("\n" + "=" * 80)
     print("MODULE 3: RESERVATION WORKFLOW, PAYMENT & PREDICTIVE ANALYTICS")
@@ -890,5 +1316,16 @@ def main():
     print("=" * 80)
 
 
+def quick_check():
+    """Cheap health check for CI and tooling: one COUNT, no demo workload"""
+    parking = SmartParkingSystem()
+    slots = parking.cursor.execute('SELECT COUNT(*) FROM parking_slots').fetchone()[0]
+    parking.close()
+    print(f"parking_system OK ({slots} slots)")
+
+
 if __name__ == "__main__":
-    main()
+    if "--quick" in sys.argv[1:]:
+        quick_check()
+    else:
+        main()